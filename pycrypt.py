@@ -3,23 +3,50 @@ pycrypt.py encrypts a directory for secure use with git, git-lfs, etc.
 """
 
 import typer
-from rich.console import Console
-from rich.progress import track
-from rich.prompt import Prompt, Confirm
 from pathlib import Path
-from typing import Optional
-from loguru import logger
+from typing import Optional, TYPE_CHECKING
 import sys
+import time
+
+# Note: rich and loguru are imported on first use so `--help` and shell completion stay fast
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Note: optional, only needed for the move-to-trash prompt
+try:
+    from send2trash import send2trash
+except ImportError:
+    send2trash = None
 
 # Initialize UX-UI
 app = typer.Typer(
     name="poincare",
     help="⚡ Poincare High-Efficiency Data Security Playbook.",
-    rich_markup_path=True
+    rich_markup_path=True,
+    no_args_is_help=True
 )
-console = Console()
-logger.remove()
-logger.add(sys.stderr, format="<green>{time:HH:mm:ss}</green> | <level>{level}</level> | {message}", level="INFO")
+_console: Optional["Console"] = None
+_logger = None
+# Note: checked once, non-TTY runs (CI, redirects) skip the progress machinery entirely
+_IS_TTY = sys.stdout.isatty()
+
+def get_console() -> "Console":
+    """Create the rich console on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+def get_logger():
+    """Configure the loguru sink on first use."""
+    global _logger
+    if _logger is None:
+        from loguru import logger
+        logger.remove()
+        logger.add(sys.stderr, format="<green>{time:HH:mm:ss}</green> | <level>{level}</level> | {message}", level="INFO")
+        _logger = logger
+    return _logger
 
 # Abstraction for interfacing with Rust implementation
 # [] TODO: make work
@@ -38,19 +65,27 @@ class MockEncryptionService(IEncryptionService):
     It simulates the complexity and speed of the final Rust service.
     """
     def encrypt_directory(self, data_path: Path, key_str: str, output_path: Path) -> float:
+        from rich.progress import Progress
+        logger = get_logger()
+
         # [] TODO: replace simulation
         logger.info(f"Starting pipeline for: {data_path.name}")
 
-        total_steps = 100
-        for step in track(range(total_steps), description="[bold blue]Running security pipeline...[/bold blue]"):
-            # Pipeline: Compression (ZSTD), Hashing (SHA256), Encryption (Fernet)
-            if step == 20: logger.debug("ZSTD Compression initiated.")
-            if step == 50: logger.debug("Integrity Hashing complete.")
-            if step == 80: logger.debug("Fernet Encryption initiated.")
-
-            # [] TODO: replace simulation
-            import time
-            time.sleep(0.01)
+        # Pipeline: Compression (ZSTD), Hashing (SHA256), Encryption (Fernet)
+        # Note: (percent complete, simulated seconds, stage message) -> one sleep per stage, not per step
+        stages = (
+            (20, 0.2, "ZSTD Compression initiated."),
+            (50, 0.3, "Integrity Hashing complete."),
+            (80, 0.3, "Fernet Encryption initiated."),
+            (100, 0.2, None),
+        )
+        with Progress(console=get_console(), refresh_per_second=4, disable=not _IS_TTY) as progress:
+            task = progress.add_task("[bold blue]Running security pipeline...[/bold blue]", total=100)
+            for completed, seconds, message in stages:
+                # [] TODO: replace simulation
+                time.sleep(seconds)
+                progress.update(task, completed=completed)
+                if message: logger.debug(message)
 
         # [] TODO: replace mock data in stages: mock_data directory and then use with real data
         output_path.write_text(f"ENCRYPTED_MOCK_DATA-{key_str}")
@@ -84,6 +119,9 @@ def encrypt_cli(
     )
 ):
     """The main CLI entry point for the encryption playbook."""
+    from rich.prompt import Prompt, Confirm
+    console = get_console()
+    logger = get_logger()
 
     # [] TODO: build a UX-UI message generator instead of writing this by hand
     # Note: consider using haskell for easy of composition and focus on pure pipeline
@@ -118,8 +156,9 @@ def encrypt_cli(
         console.print(f"Directory: [green]{target_dir.name}[/green] -> File: [green]{output_path.name}[/green]")
         console.print(f"Efficiency Baseline: [bold magenta]{duration:.3f} seconds[/bold magenta] (Target for Rust Optimization)")
 
-        if Confirm.ask("[bold red]RISK ARBITRAGE:[/bold red] Move original directory to trash?"):
-            from send2trash import send2trash
+        if send2trash is None:
+            logger.warning("send2trash not installed. Original directory left in place.")
+        elif Confirm.ask("[bold red]RISK ARBITRAGE:[/bold red] Move original directory to trash?"):
             send2trash(str(target_dir))
             logger.warning(f"Moved '{target_dir.name}' to trash.")
 
@@ -7,16 +7,57 @@ Now, I will create a multiple logging approach using tool so I can be confident
 """
 
 import sys
+import re
+import time
 import json
 import logging
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, Callable, Protocol
 from enum import Enum
 from contextlib import contextmanager
 
 # Implementing threading to leverage system resources
 import threading
+import queue
+import atexit
+
+# Note: orjson is optional (Rust, emits bytes, handles datetime natively). Fall back to stdlib json.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC)
+except ImportError:
+    orjson = None
+
+    def _json_default(obj: Any) -> Any:
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        raise TypeError(f"Type not serializable: {type(obj).__name__}")
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_json_default).encode('utf-8')
+
+# Note: one C-level pass instead of three str.replace copies
+_CTRL_TRANS = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+
+# (epoch ms, formatted) swapped as one tuple so threads never see a torn pair
+_ts_cache = (0, '')
+
+def _utc_timestamp() -> str:
+    """UTC ISO timestamp at millisecond granularity, formatted at most once per millisecond."""
+    global _ts_cache
+    ms = time.time_ns() // 1_000_000
+    cached_ms, formatted = _ts_cache
+    if ms != cached_ms:
+        formatted = (
+            datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+            .replace(tzinfo=None)
+            .isoformat(timespec='milliseconds')
+        )
+        _ts_cache = (ms, formatted)
+    return formatted
 
 class LogBackend(Protocol):
     """Python interface to allow interchanging loggers as it needed.
@@ -92,7 +133,7 @@ class StandardLibBackend:
         class JSONFormatter(logging.Formatter):
             def format(self, record):
                 log_entry = {
-                    'timestamp': datetime.utcfromtimestamp(record.created).isoformat(),
+                    'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc),
                     'level': record.levelname,
                     'message': record.getMessage(),
                     'logger': record.name,
@@ -104,7 +145,7 @@ class StandardLibBackend:
                 if hasattr(record, 'context'):
                     log_entry['context'] = record.context
 
-                return json.dumps(log_entry)
+                return _dumps(log_entry).decode('utf-8')
 
         return JSONFormatter()
 
@@ -121,11 +162,19 @@ class StandardLibBackend:
 
 
 class DirectFileBackend:
-    """If all else fails, write to a file directly using python file writing pattern."""
+    """
+    If all else fails, write to a file directly using python file writing pattern.
+
+    Note: log() only enqueues. A daemon thread drains the queue and writes each batch
+    with one buffered write() + flush() on a file handle that stays open.
+    Note: the file and thread are only opened/started by the first log(), this backend is last in line.
+    """
+
+    _STOP = object()
+    BATCH_SIZE = 256
 
     def __init__(self, log_file: Path):
         self.log_file = log_file
-        self._lock = threading.Lock()
 
         # resolved issue with directory not existing
         try:
@@ -133,17 +182,71 @@ class DirectFileBackend:
         except Exception:
             pass
 
+        self._fh = None
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def _start(self) -> None:
+        """Open the file and start the flusher thread, once."""
+        with self._start_lock:
+            if self._flusher is not None or self._closed:
+                return
+            # Note: buffered on purpose, BufferedWriter.write retries short writes that raw FileIO would drop
+            self._fh = open(self.log_file, 'ab')
+            self._flusher = threading.Thread(target=self._drain, name="direct-file-flusher", daemon=True)
+            self._flusher.start()
+            atexit.register(self.close)
+
+    def _drain(self):
+        """Write queued entries in batches until close() is called."""
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            try:
+                for _ in range(self.BATCH_SIZE - 1):
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            if self._STOP in batch:
+                batch = batch[:batch.index(self._STOP)]
+                stop = True
+
+            try:
+                self._fh.write(b''.join(batch))
+                self._fh.flush()
+            except Exception as e:
+                print(f"[LOGGING SYSTEM] Direct file write failed: {e}", file=sys.stderr)
+
+    def close(self):
+        """Flush remaining entries and close the file."""
+        with self._start_lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._flusher is None:
+            return
+        atexit.unregister(self.close)
+        self._queue.put(self._STOP)
+        self._flusher.join()
+        self._fh.close()
+
     def log(self, level: str, message: str, context: Dict[str, Any]) -> bool:
+        if self._closed:
+            return False
+
         try:
-            with self._lock:
-                with open(self.log_file, 'a', encoding='utf-8') as f:
-                    entry = {
-                        'timestamp': datetime.utcnow().isoformat(),
-                        'level': level,
-                        'message': message,
-                        'context': context
-                    }
-                    f.write(json.dumps(entry) + '\n')
+            if self._flusher is None:
+                self._start()
+            entry = {
+                'timestamp': _utc_timestamp(),
+                'level': level,
+                'message': message,
+                'context': context
+            }
+            self._queue.put(_dumps(entry) + b'\n')
             return True
         except Exception:
             return False
@@ -154,7 +257,7 @@ class StderrBackend:
 
     def log(self, level: str, message: str, context: Dict[str, Any]) -> bool:
         try:
-            timestamp = datetime.utcnow().isoformat()
+            timestamp = _utc_timestamp()
             ctx_str = f" {context}" if context else ""
             print(f"{timestamp} | {level: <8} | {message}{ctx_str}", file=sys.stderr)
             return True
@@ -171,6 +274,8 @@ class SecuritySanitizer:
         'apikey', 'auth', 'credential', 'private_key', 'access_token',
         'session_id', 'ssn', 'credit_card', 'cvv'
     }
+    # Note: one case-insensitive scan per key instead of lower() + a substring test per term
+    _SENS_RE = re.compile('|'.join(re.escape(s) for s in sorted(SENSITIVE_KEYS)), re.IGNORECASE)
 
     @classmethod
     def sanitize_message(cls, message: str) -> str:
@@ -178,12 +283,9 @@ class SecuritySanitizer:
         if not isinstance(message, str):
             message = str(message)
 
-        message = message.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
-
-        if len(message) > 10000:
-            message = message[:10000] + "... (truncated)"
+        message = message.translate(_CTRL_TRANS)
 
-        return message
+        return message if len(message) <= 10000 else message[:10000] + "... (truncated)"
 
     @classmethod
     def sanitize_context(cls, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -193,7 +295,7 @@ class SecuritySanitizer:
 
         sanitized = {}
         for key, value in context.items():
-            if any(sensitive in key.lower() for sensitive in cls.SENSITIVE_KEYS):
+            if cls._SENS_RE.search(key) is not None:
                 sanitized[key] = "***REDACTED***"
             else:
                 if isinstance(value, dict):
@@ -219,7 +321,8 @@ class Logger:
         self.log_file = log_file
         self.enable_security = enable_security
         self._backends = []
-        self._failed_backends = set()
+        self._active = ()
+        self._primary = None
         self._setup_backends(console_format, file_format)
 
     def _setup_backends(self, console_format: str, file_format: str):
@@ -251,26 +354,53 @@ class Logger:
         if not self._backends:
             raise RuntimeError("CRITICAL: All logging backends failed to initialize")
 
-    def _log(self, level: str, message: str, **context):
-        """Core logging method with defense in depth."""
+        # Note: prebind backend.log so the hot path is one call on the primary backend
+        self._active = tuple((name, backend.log) for name, backend in self._backends)
+        self._primary = self._active[0]
+
+    def _disable(self, name: str):
+        """Drop a failed backend from the active tuple."""
+        self._active = tuple(entry for entry in self._active if entry[0] != name)
+        if self._primary is not None and self._primary[0] == name:
+            self._primary = self._active[0] if self._active else None
+
+    def _safe_log(self, entry, level: str, message: str, context: Dict[str, Any]) -> bool:
+        """Call one backend, disabling it if it raises."""
+        name, log = entry
+        try:
+            return log(level, message, context)
+        except Exception as e:
+            self._disable(name)
+            self._meta_log(f"Backend {name} failed: {e}")
+            return False
+
+    def _log(self, level: str, message: str, *, _trusted: bool = False, **context):
+        """
+        Core logging method with defense in depth.
+
+        Note: _trusted=True is for internal call sites with no user input, it skips message
+        sanitization. Context is still redacted since logger.context() may inject user values.
+        """
 
         if self.enable_security:
-            message = SecuritySanitizer.sanitize_message(message)
-            context = SecuritySanitizer.sanitize_context(context)
+            if not _trusted:
+                message = SecuritySanitizer.sanitize_message(message)
+            if context:
+                context = SecuritySanitizer.sanitize_context(context)
 
-        logged = False
-        for name, backend in self._backends:
-            if name in self._failed_backends:
-                continue
+        primary = self._primary
+        logged = primary is not None and self._safe_log(primary, level, message, context)
 
-            try:
-                # When one works move on
-                if backend.log(level, message, context):
-                    logged = True
-                    break
-            except Exception as e:
-                self._failed_backends.add(name)
-                self._meta_log(f"Backend {name} failed: {e}")
+        if not logged:
+            # Primary failed: the first backend that works becomes the new primary
+            safe_log = self._safe_log
+            entry = next(
+                (e for e in self._active if e is not primary and safe_log(e, level, message, context)),
+                None
+            )
+            if entry is not None:
+                self._primary = entry
+                logged = True
 
         if not logged:
             # Note: this should be unreachable code. Escalate.
@@ -317,8 +447,11 @@ class Logger:
         original_log = self._log
 
         def wrapped_log(level: str, message: str, **kwargs):
-            merged_context = {**context_vars, **kwargs}
-            original_log(level, message, **merged_context)
+            # Note: most calls inside a context add nothing, skip building a merged dict for them
+            if not kwargs:
+                original_log(level, message, **context_vars)
+            else:
+                original_log(level, message, **{**context_vars, **kwargs})
 
         self._log = wrapped_log
         try:
@@ -336,13 +469,15 @@ def log_execution_time(logger: Logger):
         @wraps(func)
         def wrapper(*args, **kwargs):
             start = time.time()
-            logger.debug(f"Starting {func.__name__}")
+            logger._log("DEBUG", f"Starting {func.__name__}", _trusted=True)
 
             try:
                 result = func(*args, **kwargs)
                 elapsed = time.time() - start
-                logger.debug(
+                logger._log(
+                    "DEBUG",
                     f"Completed {func.__name__}",
+                    _trusted=True,
                     execution_time_seconds=elapsed
                 )
                 return result
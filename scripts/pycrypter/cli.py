@@ -10,7 +10,7 @@ import time
 from pipeline import run_step, PipelineError
 
 # Setup app
-app = typer.Typer(name="pycrypter", help="Secure Data Encryption Play.")
+app = typer.Typer(name="pycrypter", help="Secure Data Encryption Play.", no_args_is_help=True)
 console = Console()
 logger.remove(); logger.add(sys.stderr, format="<green>{time:HH:mm:ss}</green> | <level>{level}</level> | {message}", level="INFO")
 
@@ -9,29 +9,290 @@ Notes:
     - used Google style guide to refine: https://google.github.io/styleguide/pyguide.html
 """
 
+import errno
+import functools
 import hashlib
+import hmac
+import json
+import mmap
+import os
+import re
+import shutil
+import stat
+import struct
+import subprocess
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Generator
+from typing import Optional, List, Dict, Callable, Iterable, Iterator, Tuple, TypeVar, Union
 from loguru import logger
 
+from .exceptions import HashingError
+
+# Note: loguru formats f-strings at the call site even when the sink drops the level.
+# Hot per-file debug lines go through this instead so arguments are only built if emitted.
+# https://loguru.readthedocs.io/en/stable/api/logger.html#loguru._logger.Logger.opt
+_lazy_logger = logger.opt(lazy=True)
+
+# Note: optional, Rust-backed and SIMD/multi-threaded. SHA256 stays the default.
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+def _env_chunk_size(default: int = 1 << 20) -> int:
+    """Read POLYCRYPT_HASH_CHUNK once at import, falling back to default (1 MiB) if unset or invalid."""
+    raw = os.environ.get("POLYCRYPT_HASH_CHUNK")
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        logger.warning(f"Ignoring invalid POLYCRYPT_HASH_CHUNK={raw!r}, using {default}")
+        return default
+    return value
+
 # [] TODO: replace when switch to Go or Rust implementation
-DEFAULT_CHUNK_SIZE = 8192
+# Note: past one FS block bigger reads win, each read/update pair has fixed Python/C overhead
+DEFAULT_CHUNK_SIZE = _env_chunk_size()
+DEFAULT_HASH_ALGO = "sha256"
+HASH_ALGOS = ("sha256", "blake3")
+
+# Note: NVMe latency variance grows past ~32-64 outstanding reads, keep the window there
+MAX_INFLIGHT_READS = 32
+
+# Note: below ~1 GiB buffered reads win thanks to kernel readahead, above it skip the page cache
+DIRECT_IO_THRESHOLD = 1 << 30
+
+# Note: from here up hash straight from a memory map, no Python-side copy of the contents
+MMAP_THRESHOLD = 1 << 20
+
+# Note: fed first into every directory hash so v2 roll-ups can never collide with the
+# original (path || raw contents) format
+DIRECTORY_HASH_PREFIX = b"POLYCRYPT2\0"
+# Note: v2 record framing, every record is self-delimiting so no two trees share a byte stream
+# <u32 LE path length> <path> <status byte> <32-byte digest, zeros when unreadable>
+RECORD_DIGEST = b"\x01"
+RECORD_UNREADABLE = b"\x00"
+RECORD_DIGEST_SIZE = 32
+_UNREADABLE_DIGEST = bytes(RECORD_DIGEST_SIZE)
+_RECORD_PATH_LEN = struct.Struct("<I")
+
+# Note: per-file memo {abs path: [st_mtime_ns, st_ctime_ns, st_ino, st_size, hex digest]}, same idea as ccache/Nix
+# Note: mtime can be put back (touch -r, cp -p, rsync -t), ctime cannot be set from user space
+HASH_CACHE_VERSION = 2
+# Note: files modified this recently may still be changing within one mtime tick, don't memoize them
+HASH_CACHE_MIN_AGE_NS = 2_000_000_000
+
+# Note: opt-in fallback for Python builds whose OpenSSL lacks SHA-NI dispatch, sha256 only
+USE_OPENSSL_CLI = os.environ.get("POLYCRYPT_USE_OPENSSL_CLI") == "1"
+OPENSSL_CLI_THRESHOLD = 64 << 20
+
+# Note: framed v2 records are batched into one buffer and hashed per this many bytes
+ROLLUP_FLUSH_SIZE = 1 << 20
+
+# Note: calculate_file_hash emits lowercase hex, anything else can never compare equal
+_SHA256_HEX_RE = re.compile(r"[0-9a-f]{64}")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+@functools.cache
+def _log_hash_backend() -> None:
+    """Log once which digests this Python's OpenSSL build exposes."""
+    _lazy_logger.debug("hashlib algorithms available: {}", lambda: sorted(hashlib.algorithms_available))
+
+def _new_hasher(algo: str):
+    """
+    Return a fresh hasher for the requested algorithm.
+
+    Note: usedforsecurity=False (3.9+) keeps FIPS-mode OpenSSL builds from routing
+    SHA256 through a validated software path instead of SHA-NI
+    """
+    _log_hash_backend()
+    if algo == "sha256":
+        return hashlib.new("sha256", usedforsecurity=False)
+    if algo == "blake3":
+        if blake3 is None:
+            raise HashingError("blake3 requested but not installed: pip install blake3")
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    raise ValueError(f"Unsupported hash algorithm: {algo} (expected one of {HASH_ALGOS})")
+
+def _digest_file(file, algo: str):
+    """
+    Hash an open binary file with hashlib.file_digest.
+
+    Note: file_digest reuses one buffer and feeds the EVP digest directly (SHA-NI where available)
+    https://docs.python.org/3/library/hashlib.html#hashlib.file_digest
+    """
+    return hashlib.file_digest(file, lambda: _new_hasher(algo))
+
+def _digest_direct(file_path: Union[str, Path], algo: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Hash a file with O_DIRECT reads into one page-aligned buffer, bypassing the page cache.
+
+    Returns None when the platform or filesystem does not support O_DIRECT.
+    """
+    if not hasattr(os, "O_DIRECT"):
+        return None
+    try:
+        fd = os.open(file_path, os.O_RDONLY | os.O_DIRECT)
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            return None
+        raise
+
+    hasher = _new_hasher(algo)
+    try:
+        # Note: anonymous mmap is page-aligned which satisfies O_DIRECT alignment
+        # Note: O_DIRECT read sizes must be block multiples, round up to whole pages
+        block = -(-chunk_size // mmap.PAGESIZE) * mmap.PAGESIZE
+        with mmap.mmap(-1, block) as buf:
+            view = memoryview(buf)
+            try:
+                offset = 0
+                while n := os.preadv(fd, [buf], offset):
+                    hasher.update(view[:n])
+                    offset += n
+            except OSError as e:
+                if e.errno == errno.EINVAL:
+                    return None
+                raise
+            finally:
+                view.release()
+    finally:
+        os.close(fd)
+    return hasher
+
+def _digest_mmap(file, algo: str):
+    """
+    Hash an open file through a read-only memory map in a single update() call.
 
-def calculate_file_hash(file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    Returns None if the file cannot be mapped (e.g. pipes, empty files, some special filesystems).
+
+    Note: if another process truncates the file mid-hash, touching the vanished pages raises SIGBUS
+    and kills the interpreter, so only use this for files the caller expects to be stable.
+    """
+    try:
+        # Note: length 0 maps the whole file as it is now, ACCESS_READ works on Windows too
+        mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    with mm:
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        hasher = _new_hasher(algo)
+        hasher.update(mm)
+    return hasher
+
+def _digest_openssl_cli(file_path: Union[str, Path], size: int) -> Optional[str]:
+    """
+    SHA256 a file with `openssl dgst`, feeding its stdin with os.sendfile (kernel to kernel, no Python copy).
+
+    Returns the hex digest, or None if openssl or sendfile is unavailable or the subprocess fails.
+    https://docs.python.org/3/library/os.html#os.sendfile
     """
-    Use SHA256 hash to validate file hash
+    openssl = shutil.which("openssl")
+    if openssl is None or not hasattr(os, "sendfile"):
+        return None
+
+    with open(file_path, 'rb', buffering=0) as file, subprocess.Popen(
+        [openssl, "dgst", "-sha256", "-binary"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    ) as proc:
+        try:
+            offset = 0
+            # Note: sendfile may stop short, loop until the whole file went through
+            while offset < size and (sent := os.sendfile(proc.stdin.fileno(), file.fileno(), offset, size - offset)):
+                offset += sent
+        except OSError as e:
+            logger.debug(f"sendfile to openssl failed, using in-process hashing: {e}")
+            proc.kill()
+            return None
+        finally:
+            proc.stdin.close()
+        digest = proc.stdout.read()
+
+    if proc.returncode != 0 or offset != size or len(digest) != 32:
+        return None
+    return digest.hex()
+
+def _advise_sequential(file) -> None:
+    """
+    Tell the kernel the whole file will be read front to back (bigger readahead, earlier eviction).
+
+    Note: advisory only, a no-op where posix_fadvise is missing (macOS, Windows) or refused (pipes)
+    https://docs.python.org/3/library/os.html#os.posix_fadvise
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def _digest_path(
+    file_path: Union[str, Path],
+    algo: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    size: Optional[int] = None,
+    use_mmap: bool = True
+):
+    """
+    Hash a file by path (str or Path), picking the read strategy by size.
+
+    - >= DIRECT_IO_THRESHOLD: O_DIRECT, bypass the page cache
+    - >= MMAP_THRESHOLD: memory map (unless use_mmap=False)
+    - otherwise: hashlib.file_digest
+
+    Pass size when the caller already has a stat result to skip another stat call.
+    Pass use_mmap=False when files may be truncated while hashing, see _digest_mmap.
+    Files from MMAP_THRESHOLD up also get POSIX_FADV_SEQUENTIAL, below it the extra syscall costs more than it saves.
+    """
+    if size is None:
+        size = os.stat(file_path).st_size
+    if size >= DIRECT_IO_THRESHOLD:
+        hasher = _digest_direct(file_path, algo, chunk_size)
+        if hasher is not None:
+            return hasher
+        logger.debug(f"O_DIRECT unavailable, using buffered reads: {file_path}")
+
+    # Note: unbuffered, file_digest/mmap bring their own buffers so BufferedReader is a wasted copy
+    with open(file_path, 'rb', buffering=0) as file:
+        if size >= MMAP_THRESHOLD:
+            _advise_sequential(file)
+            if use_mmap:
+                hasher = _digest_mmap(file, algo)
+                if hasher is not None:
+                    return hasher
+        return _digest_file(file, algo)
+
+def calculate_file_hash(
+    file_path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    algo: str = DEFAULT_HASH_ALGO
+) -> str:
+    """
+    Use SHA256 (or BLAKE3) hash to validate file hash
 
     Args:
         file_path: Path to the file to hash
-        chunk_size: Size of chunks to read (default: 8192 bytes)
+        chunk_size: Read size for O_DIRECT (very large files), default 1 MiB or POLYCRYPT_HASH_CHUNK.
+            Hint only otherwise, mmap and file_digest size their own reads
+        algo: Hash algorithm, "sha256" (default) or "blake3"
 
     Returns:
-        SHA256 hash digest as hexadecimal string
+        Hash digest as hexadecimal string
 
     Raises:
         FileNotFoundError: If file doesn't exist
         IsADirectoryError: If path is a directory
         IOError: If file cannot be read
+        ValueError: If algo is not supported
+        HashingError: If blake3 is requested but not installed
 
     Example:
         >>> hash_value = calculate_file_hash(Path("data.txt"))
@@ -40,72 +301,226 @@ def calculate_file_hash(file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -
     """
 
     # Note: added to eliminate errors during testing
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-    if file_path.is_dir():
+    # Note: one stat answers both existence and directoryness, then it is reused for the size
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+    except OSError as e:
+        logger.error(f"Failed to read file {file_path}: {e}")
+        raise IOError(f"Error reading file {file_path}") from e
+    if stat.S_ISDIR(st.st_mode):
         raise IsADirectoryError(f"Path is a directory: {file_path}")
 
-    logger.debug(f"Calculating hash for file: {file_path}")
-    hasher = hashlib.sha256()
+    _lazy_logger.debug("Calculating hash for file: {}", lambda: file_path)
+    # Note: fail fast on a bad algo before touching the file
+    _new_hasher(algo)
 
     # [] TODO: consider abstracting into a module that applies try-except as a decorator
     try:
-        with file_path.open('rb') as file:
-            while chunk := file.read(chunk_size):
-                hasher.update(chunk)
+        hash_result = None
+        if USE_OPENSSL_CLI and algo == "sha256" and st.st_size > OPENSSL_CLI_THRESHOLD:
+            hash_result = _digest_openssl_cli(file_path, st.st_size)
+        if hash_result is None:
+            hash_result = _digest_path(file_path, algo, chunk_size, st.st_size).hexdigest()
     except (IOError, PermissionError) as e:
         logger.error(f"Failed to read file {file_path}: {e}")
         raise IOError(f"Error reading file {file_path}") from e
 
-    hash_result = hasher.hexdigest()
-    logger.info(f"File hash calculated: {file_path} -> {hash_result[:8]}...")
+    # Note: debug, not info, so batch callers (e.g. verify loops) don't emit a line per file
+    _lazy_logger.debug("File hash calculated: {} -> {}...", lambda: file_path, lambda: hash_result[:8])
     return hash_result
 
-def _hash_directory_contents(directory: Path, exclude_patterns: List[str]) -> Generator[bytes, None, None]:
+def _digest_entry(entry: os.DirEntry, algo: str) -> Optional[bytes]:
     """
-    Generator that yields hashed content of directory for memory efficiency.
+    Digest a single file for the directory walk, None if it cannot be read.
 
-    https://docs.python.org/3/tutorial/classes.html#generators
+    Note: DirEntry caches its stat result, so the cache check and this call share one stat
+    Note: no mmap here, a walk over live trees (logs, files being written) must not die of SIGBUS
     """
-    all_files = sorted(
-        (f for f in directory.rglob('*') if f.is_file()),
-        key=lambda p: str(p.relative_to(directory))
-    )
-
-    for file_path in all_files:
-        if any(pattern in file_path.name for pattern in exclude_patterns):
-            logger.debug(f"Skipping excluded file: {file_path}")
-            continue
+    try:
+        return _digest_path(entry.path, algo, size=entry.stat().st_size, use_mmap=False).digest()
+    except (IOError, PermissionError) as e:
+        logger.warning(f"Skipping unreadable file {entry.path}: {e}")
+        return None
 
-        rel_path = file_path.relative_to(directory)
-        yield str(rel_path).encode('utf-8')
+def _load_hash_cache(cache_file: Path, algo: str) -> Dict[str, list]:
+    """Load per-file cache entries, empty if missing, unreadable, or written for another algo/version."""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable hash cache {cache_file}: {e}")
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != HASH_CACHE_VERSION or data.get("algo") != algo:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+def _save_hash_cache(cache_file: Path, algo: str, entries: Dict[str, list]) -> None:
+    """Persist cache entries atomically (write temp file, then os.replace)."""
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": HASH_CACHE_VERSION, "algo": algo, "entries": entries}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to write hash cache {cache_file}: {e}")
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+
+def _digest_file_cached(
+    entry: os.DirEntry,
+    algo: str,
+    cache: Dict[str, list],
+    seen: Dict[str, list]
+) -> Optional[bytes]:
+    """
+    Digest a file through the (path, mtime_ns, ctime_ns, inode, size) memo, hashing only on a miss.
 
+    Entries for files seen in this walk are recorded in `seen`, which becomes the new cache.
+    """
+    key = os.path.abspath(entry.path)
+    try:
+        st = entry.stat()
+    except OSError as e:
+        logger.warning(f"Skipping unreadable file {entry.path}: {e}")
+        return None
+
+    stamp = [st.st_mtime_ns, st.st_ctime_ns, st.st_ino, st.st_size]
+    digest = None
+    hit = cache.get(key)
+    if isinstance(hit, list) and len(hit) == 5 and hit[:4] == stamp:
         try:
-            with file_path.open('rb') as f:
-                while chunk := f.read(DEFAULT_CHUNK_SIZE):
-                    yield chunk
-        except (IOError, PermissionError) as e:
-            logger.warning(f"Skipping unreadable file {file_path}: {e}")
+            digest = bytes.fromhex(hit[4])
+        except (TypeError, ValueError):
+            digest = None
+
+    if digest is None:
+        digest = _digest_entry(entry, algo)
+        if digest is None:
+            return None
+
+    if time.time_ns() - max(st.st_mtime_ns, st.st_ctime_ns) >= HASH_CACHE_MIN_AGE_NS:
+        seen[key] = stamp + [digest.hex()]
+    return digest
+
+def _bounded_map(
+    executor: ThreadPoolExecutor,
+    func: Callable[[T], R],
+    items: Iterable[T],
+    window: int = MAX_INFLIGHT_READS
+) -> Iterator[R]:
+    """
+    Ordered executor.map that keeps at most `window` jobs in flight.
+
+    Note: executor.map submits everything up front, this keeps a fixed queue depth instead
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(func, item))
+    while pending:
+        yield pending.popleft().result()
+
+def _iter_files(root: str, rel_root: str = "") -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Recursively yield (relative path, DirEntry) for every file under root.
+
+    Note: entries are sorted per directory with os.sep appended to directory names, which
+    gives the same order as sorting the full relative paths without building them all first.
+    Directories are entered with follow_symlinks=False, files are checked like Path.is_file().
+    Unreadable directories are skipped with a warning, as Path.rglob skips them.
+
+    https://docs.python.org/3/library/os.html#os.scandir
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = [
+                (entry.name + os.sep if entry.is_dir(follow_symlinks=False) else entry.name, entry)
+                for entry in it
+            ]
+    except PermissionError as e:
+        logger.warning(f"Skipping unreadable directory {root}: {e}")
+        return
+    entries.sort(key=lambda pair: pair[0])
+
+    for key, entry in entries:
+        rel = rel_root + entry.name
+        if key[-1] == os.sep:
+            yield from _iter_files(entry.path, rel + os.sep)
+        elif entry.is_file():
+            yield rel, entry
+
+def _compile_excludes(exclude_patterns: List[str]) -> Optional[re.Pattern]:
+    """
+    Compile substring exclude patterns into one alternation, None when there are none.
+
+    Note: one C-level scan per filename instead of a Python `in` test per pattern
+    """
+    if not exclude_patterns:
+        return None
+    return re.compile('|'.join(map(re.escape, exclude_patterns)))
+
+def _included_files(
+    directory: Path,
+    exclude_re: Optional[re.Pattern],
+    exclude_names: frozenset = frozenset()
+) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Yield (relative path, DirEntry) for each file in the walk whose name does not match exclude_re.
+
+    Note: exclude_names is a hash-lookup shortcut for basenames like ".DS_Store", any name equal
+    to a pattern also contains it, so exclude_re still decides everything else (substring semantics)
+    """
+    for rel, entry in _iter_files(str(directory)):
+        name = entry.name
+        if name in exclude_names or (exclude_re is not None and exclude_re.search(name)):
+            _lazy_logger.debug("Skipping excluded file: {}", lambda: entry.path)
             continue
+        yield rel, entry
 
 def calculate_directory_hash(
     directory: Path,
-    exclude_patterns: Optional[List[str]] = None
+    exclude_patterns: Optional[List[str]] = None,
+    algo: str = DEFAULT_HASH_ALGO,
+    max_workers: Optional[int] = None,
+    cache_file: Optional[Path] = None
 ) -> str:
     """
-    Use SHA256 to hash entire directory.
+    Use SHA256 (or BLAKE3) to hash entire directory.
+
+    Format v2: the hash over DIRECTORY_HASH_PREFIX, then one record per file in
+    sorted relative-path order: path length (u32 LE), relative path, a status
+    byte (RECORD_DIGEST / RECORD_UNREADABLE) and the file's 32-byte digest
+    (zeros when unreadable). Files are digested in parallel, so the result
+    does not depend on which thread finishes first.
+
+    With cache_file, per-file digests are memoized by (path, mtime_ns, ctime_ns, inode, size)
+    so only changed files are re-read. The result is the same either way.
 
     Args:
         directory: Path to the directory to hash
         exclude_patterns: List of filename patterns to exclude from hashing
+        algo: Hash algorithm, "sha256" (default) or "blake3"
+        max_workers: Files hashed concurrently (default: MAX_INFLIGHT_READS), 1 for spinning disks
+        cache_file: Optional JSON memo of per-file digests, keep it outside `directory`
 
     Returns:
-        SHA256 hash digest as hexadecimal string
+        Hash digest as hexadecimal string
 
     Raises:
         FileNotFoundError: If directory doesn't exist
-        ValueError: If path is not a directory
+        ValueError: If path is not a directory, algo is not supported or max_workers < 1
         PermissionError: If directory cannot be accessed
+        HashingError: If blake3 is requested but not installed
 
     Example:
         >>> hash_value = calculate_directory_hash(Path("project/"))
@@ -117,29 +532,70 @@ def calculate_directory_hash(
     if not directory.is_dir():
         raise ValueError(f"Path is not a directory: {directory}")
 
-    exclude_patterns = exclude_patterns or []
+    max_workers = MAX_INFLIGHT_READS if max_workers is None else max_workers
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1: {max_workers}")
     logger.debug(f"Calculating directory hash for: {directory}")
 
-    hasher = hashlib.sha256()
+    hasher = _new_hasher(algo)
+    hasher.update(DIRECTORY_HASH_PREFIX)
+
+    # Note: digests come back in sorted order with at most max_workers reads outstanding
+    # https://docs.python.org/3/library/concurrent.futures.html#threadpoolexecutor
+    cache = _load_hash_cache(cache_file, algo) if cache_file else {}
+    seen: Dict[str, list] = {}
 
+    def digest(item: Tuple[str, os.DirEntry]) -> Tuple[str, Optional[bytes]]:
+        rel, entry = item
+        if cache_file:
+            return rel, _digest_file_cached(entry, algo, cache, seen)
+        return rel, _digest_entry(entry, algo)
+
+    # Note: hashing is streaming, one update over the concatenation == one update per record
+    rollup = bytearray()
+    extend = rollup.extend
+    pack_len = _RECORD_PATH_LEN.pack
     try:
-        for chunk in _hash_directory_contents(directory, exclude_patterns):
-            hasher.update(chunk)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            files = _included_files(
+                directory, _compile_excludes(exclude_patterns), frozenset(exclude_patterns or ())
+            )
+            for rel, file_digest in _bounded_map(executor, digest, files, max_workers):
+                # Note: fsencode round-trips undecodable names (surrogateescape) instead of raising
+                rel_b = os.fsencode(rel)
+                extend(pack_len(len(rel_b)))
+                extend(rel_b)
+                if file_digest is None:
+                    extend(RECORD_UNREADABLE)
+                    extend(_UNREADABLE_DIGEST)
+                else:
+                    extend(RECORD_DIGEST)
+                    extend(file_digest)
+                if len(rollup) >= ROLLUP_FLUSH_SIZE:
+                    hasher.update(rollup)
+                    rollup.clear()
     except PermissionError as e:
         logger.error(f"Permission denied accessing directory: {directory}")
         raise PermissionError(f"Permission denied accessing {directory}") from e
+    hasher.update(rollup)
+
+    if cache_file:
+        _save_hash_cache(cache_file, algo, seen)
 
     hash_result = hasher.hexdigest()
     logger.info(f"Directory hash calculated: {directory} -> {hash_result[:8]}...")
     return hash_result
 
-def verify_file_integrity(file_path: Path, expected_hash: str) -> bool:
+def verify_file_integrity(file_path: Path, expected_hash: Union[str, bytes]) -> bool:
     """
     Verify file integrity by comparing calculated hash with expected hash.
 
+    Note: constant-time comparison (hmac.compare_digest), no early exit on the first differing byte
+    Note: a malformed expected_hash (wrong length, not lowercase hex) is rejected before reading the file
+
     Args:
         file_path: Path to the file to verify
-        expected_hash: Expected SHA256 hash value
+        expected_hash: Expected SHA256 hash value, hex string or raw 32-byte digest
 
     Returns:
         True if hashes match, False otherwise
@@ -147,9 +603,19 @@ def verify_file_integrity(file_path: Path, expected_hash: str) -> bool:
     Example:
         >>> is_valid = verify_file_integrity(Path("data.txt"), "abc123...")
     """
+    if isinstance(expected_hash, (bytes, bytearray)):
+        malformed = len(expected_hash) != 32
+    else:
+        malformed = not (isinstance(expected_hash, str) and _SHA256_HEX_RE.fullmatch(expected_hash))
+    if malformed:
+        logger.warning(f"Malformed expected hash for {file_path}, not a SHA256 digest")
+        return False
+
     try:
         actual_hash = calculate_file_hash(file_path)
-        return actual_hash == expected_hash
+        if isinstance(expected_hash, (bytes, bytearray)):
+            return hmac.compare_digest(bytes.fromhex(actual_hash), expected_hash)
+        return hmac.compare_digest(actual_hash, expected_hash)
     except Exception as e:
         logger.error(f"Integrity verification failed for {file_path}: {e}")
         return False
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import os
 import time
 from loguru import logger
 from typing import Callable, Any
@@ -16,11 +17,11 @@ class Pipeline:
     """
     def __init__(self, step_name: str):
         self.step_name = step_name
-        self.start_time = 0.0
+        self.start_time = 0
 
     def __enter__(self):
         """Do this before."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         logger.info(f"[{self.step_name}] Starting execution...")
         # Notes:
         # - context is key to implementation:
@@ -31,7 +32,7 @@ class Pipeline:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Do this after."""
-        duration = time.time() - self.start_time
+        duration = (time.perf_counter_ns() - self.start_time) / 1e9
 
         # Expected behavior: build a log of errors and return custom error
         if exc_type is not None:
@@ -46,9 +47,17 @@ def run_step(step_func: Callable[..., Any], **kwargs: Any) -> Any:
     Executes a single function in the pipeline
 
     Note: may be useful if want to understand stack and heap usage later
+    Note: timing and start/success logs only run with POLYCRYPT_PIPELINE_TRACE=1, failures are always wrapped
     """
     step_name = step_func.__name__
 
+    if os.environ.get("POLYCRYPT_PIPELINE_TRACE") != "1":
+        try:
+            return step_func(**kwargs)
+        except Exception as e:
+            logger.error(f"[{step_name}] FAILED. Error: {e}")
+            raise PipelineError(f"Step '{step_name}' failed.") from e
+
     with Pipeline(step_name) as context:
         # Do f(x) with any number of arguments
         result = step_func(**kwargs)